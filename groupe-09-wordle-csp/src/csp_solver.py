@@ -1,5 +1,7 @@
 from collections import Counter
 
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
 def wordle_feedback_vjg(secret: str, guess: str) -> str:
     """
     Feedback Wordle (FR) :
@@ -32,6 +34,45 @@ def wordle_feedback_vjg(secret: str, guess: str) -> str:
     return "".join(res)
 
 
+def _iter_valid_attempts(attempts):
+    """
+    Parcourt les tentatives et ne garde que celles bien formées.
+
+    Produit des triplets (index, guess, fb) où index est la position de la
+    tentative dans `attempts` (utile pour désigner une tentative fautive).
+    Les entrées mal formées sont ignorées plutôt que de planter le solver.
+    """
+    for index, item in enumerate(attempts):
+        # On attend un couple (guess, fb). Si ce n'est pas le cas : on ignore.
+        if not isinstance(item, (list, tuple)) or len(item) != 2:
+            continue
+
+        guess, fb = item
+
+        # Les deux éléments doivent être des strings
+        if not isinstance(guess, str) or not isinstance(fb, str):
+            continue
+
+        # Normalisation (le solver travaille en majuscules, sans espaces)
+        guess = guess.strip().upper()
+        fb = fb.strip().upper()
+
+        # Wordle = 5 lettres, 5 feedbacks
+        if len(guess) != 5 or len(fb) != 5:
+            continue
+
+        # Feedback doit contenir uniquement V/J/G
+        if any(c not in "VJG" for c in fb):
+            continue
+
+        # Guess doit contenir uniquement des lettres A-Z
+        # (si tu gères les accents, on pourra adapter plus tard)
+        if any(not ("A" <= ch <= "Z") for ch in guess):
+            continue
+
+        yield index, guess, fb
+
+
 def solve_wordle_csp(possible_words, attempts):
     """
     Résout Wordle par filtrage de contraintes (approche CSP "par vérification").
@@ -62,37 +103,14 @@ def solve_wordle_csp(possible_words, attempts):
     # 1) Nettoyage / validation des contraintes (attempts)
     #    Objectif : ignorer toute entrée mal formée plutôt que planter le solver.
     # -------------------------------------------------------------------------
-    cleaned_attempts = []
-
-    for item in attempts:
-        # On attend un couple (guess, fb). Si ce n'est pas le cas : on ignore.
-        if not isinstance(item, (list, tuple)) or len(item) != 2:
-            continue
-
-        guess, fb = item
-
-        # Les deux éléments doivent être des strings
-        if not isinstance(guess, str) or not isinstance(fb, str):
-            continue
-
-        # Normalisation (le solver travaille en majuscules, sans espaces)
-        guess = guess.strip().upper()
-        fb = fb.strip().upper()
+    cleaned_attempts = [(guess, fb) for _, guess, fb in _iter_valid_attempts(attempts)]
 
-        # Wordle = 5 lettres, 5 feedbacks
-        if len(guess) != 5 or len(fb) != 5:
-            continue
-
-        # Feedback doit contenir uniquement V/J/G
-        if any(c not in "VJG" for c in fb):
-            continue
-
-        # Guess doit contenir uniquement des lettres A-Z
-        # (si tu gères les accents, on pourra adapter plus tard)
-        if any(not ("A" <= ch <= "Z") for ch in guess):
-            continue
-
-        cleaned_attempts.append((guess, fb))
+    # -------------------------------------------------------------------------
+    # 1bis) Propagation : si les contraintes compilées sont déjà contradictoires,
+    #       aucun mot ne peut convenir -> inutile de parcourir le dictionnaire.
+    # -------------------------------------------------------------------------
+    if not compile_wordle_constraints(cleaned_attempts)["consistent"]:
+        return []
 
     # -------------------------------------------------------------------------
     # 2) Filtrage du dictionnaire
@@ -124,3 +142,223 @@ def solve_wordle_csp(possible_words, attempts):
 
     return solutions
 
+
+# ---------------------------------------------------------------------------
+# Propagation de contraintes (sans parcourir le dictionnaire)
+# ---------------------------------------------------------------------------
+def _new_model():
+    """
+    Modèle compilé vide :
+      - domains    : pour chaque position, l'ensemble des lettres encore permises
+      - min_counts : nombre minimal d'occurrences connu pour une lettre
+      - max_counts : nombre maximal d'occurrences connu pour une lettre
+    """
+    return {
+        "domains": [set(ALPHABET) for _ in range(5)],
+        "min_counts": {},
+        "max_counts": {},
+    }
+
+
+def _apply_attempt(model, guess, fb):
+    """
+    Ajoute une tentative (guess, fb) au modèle compilé et propage.
+
+    Traduction d'un feedback en contraintes (équivalente à
+    wordle_feedback_vjg(secret, guess) == fb) :
+      - V en i        : domaine[i] = {guess[i]}
+      - J ou G en i   : guess[i] retiré de domaine[i]
+      - lettre c avec k marques V/J : au moins k occurrences de c
+      - si c a aussi un G           : exactement k occurrences de c
+
+    Retourne False dès qu'une contradiction locale est détectée.
+    """
+    # Wordle attribue les jaunes de gauche à droite : pour une même lettre,
+    # un J situé après un G est un feedback impossible.
+    seen_gray = set()
+    for ch, f in zip(guess, fb):
+        if f == "G":
+            seen_gray.add(ch)
+        elif f == "J" and ch in seen_gray:
+            return False
+
+    domains = model["domains"]
+    min_counts = model["min_counts"]
+    max_counts = model["max_counts"]
+
+    marked = Counter()
+    gray = set()
+    for i, (ch, f) in enumerate(zip(guess, fb)):
+        if f == "V":
+            domains[i].intersection_update(ch)
+        else:
+            domains[i].discard(ch)
+
+        if f == "G":
+            gray.add(ch)
+        else:
+            marked[ch] += 1
+
+    for ch in set(guess):
+        k = marked[ch]
+        if k > min_counts.get(ch, 0):
+            min_counts[ch] = k
+        if ch in gray and k < max_counts.get(ch, 5):
+            max_counts[ch] = k
+            if k == 0:
+                # Lettre absente du mot : on la retire de toutes les positions
+                for dom in domains:
+                    dom.discard(ch)
+
+    if any(not dom for dom in domains):
+        return False
+    if any(lo > max_counts.get(ch, 5) for ch, lo in min_counts.items()):
+        return False
+    if sum(min_counts.values()) > 5:
+        return False
+
+    return True
+
+
+def _is_satisfiable(model):
+    """
+    Vérifie qu'il existe au moins un mot de {A..Z}^5 (pas forcément dans le
+    dictionnaire) qui respecte les domaines et les bornes d'occurrences.
+
+    Recherche en profondeur sur les 5 positions. Les lettres sans borne
+    d'occurrences sont interchangeables : une seule est essayée par position.
+    """
+    domains = model["domains"]
+    min_counts = model["min_counts"]
+    max_counts = model["max_counts"]
+    constrained = set(min_counts) | set(max_counts)
+    counts = Counter()
+
+    def dfs(pos):
+        deficit = sum(max(0, lo - counts[ch]) for ch, lo in min_counts.items())
+        if deficit > 5 - pos:
+            return False
+        if pos == 5:
+            return True
+
+        options = sorted(ch for ch in domains[pos] if ch in constrained)
+        free = next((ch for ch in domains[pos] if ch not in constrained), None)
+        if free is not None:
+            options.append(free)
+
+        for ch in options:
+            if counts[ch] >= max_counts.get(ch, 5):
+                continue
+            counts[ch] += 1
+            if dfs(pos + 1):
+                return True
+            counts[ch] -= 1
+        return False
+
+    return dfs(0)
+
+
+def _consistent(attempts):
+    """True si la liste (déjà nettoyée) de (guess, fb) est satisfiable."""
+    model = _new_model()
+    for guess, fb in attempts:
+        if not _apply_attempt(model, guess, fb):
+            return False
+    return _is_satisfiable(model)
+
+
+def compile_wordle_constraints(attempts):
+    """
+    Compile l'historique des tentatives en domaines par position et en bornes
+    d'occurrences par lettre, sans consulter le dictionnaire.
+
+    Paramètres
+    ----------
+    attempts : list[tuple[str, str]]
+        Même format que pour solve_wordle_csp (les entrées mal formées sont ignorées).
+
+    Retour
+    ------
+    dict
+        {
+          "domains": [set[str]] * 5,   # lettres permises par position
+          "min_counts": {lettre: int}, # occurrences minimales
+          "max_counts": {lettre: int}, # occurrences maximales (si connues)
+          "consistent": bool,          # False si les tentatives se contredisent
+        }
+    """
+    model = _new_model()
+    consistent = True
+
+    for _, guess, fb in _iter_valid_attempts(attempts):
+        if not _apply_attempt(model, guess, fb):
+            consistent = False
+            break
+
+    model["consistent"] = consistent and _is_satisfiable(model)
+    return model
+
+
+def find_conflicting_attempts(attempts):
+    """
+    Explique une incohérence : renvoie un ensemble minimal de tentatives
+    contradictoires.
+
+    Stratégie (recherche incrémentale d'un "unsat core") :
+      1) on ajoute les tentatives une par une jusqu'à la première contradiction ;
+         la dernière ajoutée fait forcément partie du conflit ;
+      2) on retire ensuite chaque tentative précédente : si le reste est encore
+         contradictoire, elle n'était pas nécessaire.
+
+    Le résultat est minimal au sens où retirer n'importe laquelle des tentatives
+    renvoyées rend l'ensemble cohérent.
+
+    Retour
+    ------
+    list[int]
+        Indices (dans `attempts`) des tentatives en conflit, [] si tout est cohérent.
+    """
+    valid = list(_iter_valid_attempts(attempts))
+
+    # 1) Plus petit préfixe contradictoire
+    model = _new_model()
+    prefix = None
+    for n, (_, guess, fb) in enumerate(valid):
+        if not _apply_attempt(model, guess, fb) or not _is_satisfiable(model):
+            prefix = valid[: n + 1]
+            break
+
+    if prefix is None:
+        return []
+
+    # 2) Minimisation par suppression
+    core = prefix
+    for item in prefix[:-1]:
+        trial = [other for other in core if other is not item]
+        if not _consistent([(guess, fb) for _, guess, fb in trial]):
+            core = trial
+
+    return [index for index, _, _ in core]
+
+
+def is_hard_mode_guess(guess, compiled):
+    """
+    Vérifie qu'un guess respecte le "hard mode" vis-à-vis des contraintes compilées :
+      - chaque position fixée (lettre verte) doit être réutilisée à la même place,
+      - chaque lettre révélée (verte/jaune) doit apparaître au moins autant de fois.
+
+    Coût constant : 5 positions + au plus 5 lettres requises.
+    """
+    if not isinstance(guess, str):
+        return False
+
+    guess = guess.strip().upper()
+    if len(guess) != 5:
+        return False
+
+    for ch, dom in zip(guess, compiled["domains"]):
+        if len(dom) == 1 and ch not in dom:
+            return False
+
+    counts = Counter(guess)
+    return all(counts[ch] >= lo for ch, lo in compiled["min_counts"].items())
@@ -4,7 +4,12 @@ from typing import Optional
 
 import ollama
 
-from csp_solver import solve_wordle_csp
+from csp_solver import (
+    compile_wordle_constraints,
+    find_conflicting_attempts,
+    is_hard_mode_guess,
+    solve_wordle_csp,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -231,6 +236,9 @@ def interroger_agent_wordle(prompt_utilisateur: str, dictionary_words, attempts:
     if not guess or not feedback:
         return "Invalid guess/feedback after normalization. Please use 5 letters and V/J/G."
 
+    # Hard mode : le nouveau guess réutilise-t-il les indices déjà révélés ?
+    hard_mode_ok = is_hard_mode_guess(guess, compile_wordle_constraints(attempts))
+
     # 3) Mise à jour de l'historique des contraintes
     attempts.append((guess, feedback))
 
@@ -240,8 +248,21 @@ def interroger_agent_wordle(prompt_utilisateur: str, dictionary_words, attempts:
     # Si plus aucun mot ne satisfait les contraintes, il y a incohérence (erreur feedback,
     # mot hors dictionnaire, ou extraction incorrecte)
     if not possible:
+        # On désigne les tentatives en conflit (ensemble minimal) pour aider à
+        # retrouver celle qui a été mal saisie.
+        conflict = find_conflicting_attempts(attempts)
+        if conflict:
+            explanation = "Conflicting attempts (fix one of them):\n" + "\n".join(
+                f"  #{i + 1}: {attempts[i][0]} -> {attempts[i][1]}" for i in conflict
+            )
+        else:
+            explanation = (
+                "The attempts are consistent with each other, "
+                "but no dictionary word satisfies them."
+            )
         return (
             "No solution matches the current constraints.\n"
+            f"{explanation}\n"
             f"Last attempt: {guess} -> {feedback}\n"
             f"History: {attempts}"
         )
@@ -294,6 +315,8 @@ Priority ranking:
             f"\n(Note: CSP found {len(possible)} words; "
             f"only {MAX_CANDIDATES_TO_LLM} were sent to the LLM.)\n"
         )
+    if not hard_mode_ok:
+        note += f"\n(Note: {guess} does not respect hard mode: revealed hints were not all reused.)\n"
 
     return (
         f"ADDED ATTEMPT: {guess} -> {feedback}\n"